@@ -9,7 +9,8 @@ Implements the Agent-Centric Orchestration pattern:
 Supports multiple LLM providers: Google (Gemini) and MegaLLM (DeepSeek).
 """
 
-import json
+import asyncio
+import re
 import time
 from dataclasses import dataclass, field
 from typing import Any
@@ -17,14 +18,65 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.mcp.tools import mcp_tools
-from app.shared.integrations.gemini_client import GeminiClient
-from app.shared.integrations.megallm_client import MegaLLMClient
-from app.shared.logger import agent_logger, AgentWorkflow, WorkflowStep
+from app.shared.integrations.gemini_client import get_gemini_client
+from app.shared.integrations.megallm_client import get_megallm_client
+from app.shared.logger import agent_logger, dump_json, AgentWorkflow, WorkflowStep
 
 
 # Default coordinates for Da Nang (if no location specified)
 DANANG_CENTER = (16.0544, 108.2022)
 
+# Keyword tables for intent detection and tool planning, built once at import
+LOCATION_KEYWORDS = ("gần", "cách", "nearby", "gần đây", "quanh", "xung quanh")
+SOCIAL_KEYWORDS = (
+    "review", "tin hot", "trend", "tin mới", "tiktok", "facebook", "reddit",
+    "youtube", "mạng xã hội",
+)
+SOCIAL_PLATFORMS = ("tiktok", "facebook", "reddit", "youtube", "twitter", "instagram")
+
+# One alternation per keyword list: a single regex scan replaces a
+# substring search per keyword
+_LOCATION_PATTERN = re.compile("|".join(map(re.escape, LOCATION_KEYWORDS)))
+_SOCIAL_PATTERN = re.compile("|".join(map(re.escape, SOCIAL_KEYWORDS)))
+
+# Landmark aliases (lowercase) -> canonical location name
+KNOWN_LOCATIONS = {
+    "mỹ khê": "My Khe Beach",
+    "my khe": "My Khe Beach",
+    "bãi biển mỹ khê": "My Khe Beach",
+    "cầu rồng": "Dragon Bridge",
+    "cau rong": "Dragon Bridge",
+    "dragon bridge": "Dragon Bridge",
+    "bà nà": "Ba Na Hills",
+    "ba na": "Ba Na Hills",
+    "bà nà hills": "Ba Na Hills",
+    "sơn trà": "Son Tra Peninsula",
+    "son tra": "Son Tra Peninsula",
+    "hội an": "Hoi An",
+    "hoi an": "Hoi An",
+    "ngũ hành sơn": "Marble Mountains",
+    "ngu hanh son": "Marble Mountains",
+    "marble mountains": "Marble Mountains",
+}
+
+# Place category -> keywords that signal it
+PLACE_CATEGORIES = {
+    "cafe": ("cafe", "cà phê", "coffee"),
+    "restaurant": ("nhà hàng", "quán ăn", "restaurant", "ăn"),
+    "beach": ("bãi biển", "beach", "biển"),
+    "attraction": ("điểm tham quan", "du lịch", "attraction"),
+    "hotel": ("khách sạn", "hotel", "lưu trú"),
+    "bar": ("bar", "pub", "quán bar"),
+}
+
+TOOL_PURPOSES = {
+    "retrieve_context_text": "Tìm kiếm semantic trong văn bản (review, mô tả)",
+    "retrieve_similar_visuals": "Tìm địa điểm có hình ảnh tương tự",
+    "find_nearby_places": "Tìm địa điểm gần vị trí được nhắc đến",
+    "search_social_media": "Tìm kiếm thông tin từ mạng xã hội (news, trends)",
+}
+
+
 # System prompt for the agent - balanced for all 3 tools
 SYSTEM_PROMPT = """Bạn là trợ lý du lịch thông minh cho Đà Nẵng. Bạn có 3 công cụ tìm kiếm:
 
@@ -115,9 +167,9 @@ class MMCAAgent:
 
         # Initialize LLM client based on provider
         if provider == "Google":
-            self.llm_client = GeminiClient(model=model)
+            self.llm_client = get_gemini_client(model)
         else:
-            self.llm_client = MegaLLMClient(model=model)
+            self.llm_client = get_megallm_client(model)
         
         agent_logger.workflow_step("Agent initialized", f"Provider: {provider}, Model: {model}")
 
@@ -174,18 +226,13 @@ class MMCAAgent:
             output_summary=", ".join([tc.tool_name for tc in tool_calls])
         ))
 
-        # Step 2: Execute tools
+        # Step 2: Execute tools concurrently (they are independent I/O calls)
         agent_logger.workflow_step("Step 2: Execute Tools", f"{len(tool_calls)} tool(s)")
-        tool_results = []
+        tool_results = await asyncio.gather(
+            *(self._timed_execute_tool(tool_call, db) for tool_call in tool_calls)
+        )
         
-        for tool_call in tool_calls:
-            tool_start = time.time()
-            
-            agent_logger.tool_call(tool_call.tool_name, tool_call.arguments)
-            
-            result = await self._execute_tool(tool_call, db)
-            result.duration_ms = (time.time() - tool_start) * 1000
-            
+        for tool_call, result in zip(tool_calls, tool_results):
             result_count = len(result.result) if result.result else 0
             agent_logger.tool_result(
                 tool_call.tool_name,
@@ -198,12 +245,10 @@ class MMCAAgent:
                 step_name=f"Execute {tool_call.tool_name}",
                 tool_name=tool_call.tool_name,
                 purpose=self._get_tool_purpose(tool_call.tool_name),
-                input_summary=json.dumps(tool_call.arguments, ensure_ascii=False)[:100],
+                input_summary=dump_json(tool_call.arguments)[:100],
                 result_count=result_count,
                 duration_ms=result.duration_ms
             ))
-            
-            tool_results.append(result)
 
         # Step 3: Synthesize response with history context
         agent_logger.workflow_step("Step 3: Synthesize Response")
@@ -241,33 +286,26 @@ class MMCAAgent:
     def _detect_intent(self, message: str, image_url: str | None) -> str:
         """Detect user intent for logging."""
         intents = []
+        message_lower = message.lower()
         
         if image_url:
             intents.append("visual_search")
         
-        location_keywords = ["gần", "cách", "nearby", "gần đây", "quanh", "xung quanh"]
-        if any(kw in message.lower() for kw in location_keywords):
+        if _LOCATION_PATTERN.search(message_lower):
             intents.append("location_search")
         
         if not intents:
             intents.append("text_search")
         
         # Social intent detection
-        social_keywords = ["review", "tin hot", "trend", "tin mới", "tiktok", "facebook", "reddit", "youtube", "mạng xã hội"]
-        if any(kw in message.lower() for kw in social_keywords):
+        if _SOCIAL_PATTERN.search(message_lower):
             intents.append("social_search")
             
         return " + ".join(intents)
 
     def _get_tool_purpose(self, tool_name: str) -> str:
         """Get human-readable purpose for tool."""
-        purposes = {
-            "retrieve_context_text": "Tìm kiếm semantic trong văn bản (review, mô tả)",
-            "retrieve_similar_visuals": "Tìm địa điểm có hình ảnh tương tự",
-            "find_nearby_places": "Tìm địa điểm gần vị trí được nhắc đến",
-            "search_social_media": "Tìm kiếm thông tin từ mạng xã hội (news, trends)",
-        }
-        return purposes.get(tool_name, tool_name)
+        return TOOL_PURPOSES.get(tool_name, tool_name)
 
     async def _plan_tool_calls(
         self,
@@ -280,6 +318,7 @@ class MMCAAgent:
         Returns list of ToolCall objects with tool_name and arguments.
         """
         tool_calls = []
+        message_lower = message.lower()
 
         # If image is provided, always use visual search
         if image_url:
@@ -289,17 +328,16 @@ class MMCAAgent:
             ))
 
         # Check for social media intent FIRST
-        social_keywords = ["review", "tin hot", "trend", "tin mới", "tiktok", "facebook", "reddit", "youtube", "mạng xã hội"]
-        if any(kw in message.lower() for kw in social_keywords):
+        if _SOCIAL_PATTERN.search(message_lower):
             # Determine freshness
             freshness = "pw" # Default past week
-            if "tháng" in message.lower() or "month" in message.lower():
+            if "tháng" in message_lower or "month" in message_lower:
                 freshness = "pm"
             
             # Determine platforms
             platforms = []
-            for p in ["tiktok", "facebook", "reddit", "youtube", "twitter", "instagram"]:
-                if p in message.lower():
+            for p in SOCIAL_PLATFORMS:
+                if p in message_lower:
                     platforms.append(p)
             
             tool_calls.append(ToolCall(
@@ -313,11 +351,10 @@ class MMCAAgent:
             ))
 
         # Analyze message for location/proximity queries
-        location_keywords = ["gần", "cách", "nearby", "gần đây", "quanh", "xung quanh"]
-        if any(kw in message.lower() for kw in location_keywords):
+        if _LOCATION_PATTERN.search(message_lower):
             # Extract location name from message
-            location = self._extract_location(message)
-            category = self._extract_category(message)
+            location = self._extract_location(message_lower)
+            category = self._extract_category(message_lower)
 
             # Get coordinates for the location
             coords = await self.tools.get_location_coordinates(location) if location else None
@@ -346,6 +383,18 @@ class MMCAAgent:
 
         return tool_calls
 
+    async def _timed_execute_tool(
+        self,
+        tool_call: ToolCall,
+        db: AsyncSession,
+    ) -> ToolCall:
+        """Execute a tool and record its wall-clock duration."""
+        tool_start = time.time()
+        agent_logger.tool_call(tool_call.tool_name, tool_call.arguments)
+        result = await self._execute_tool(tool_call, db)
+        result.duration_ms = (time.time() - tool_start) * 1000
+        return result
+
     async def _execute_tool(
         self,
         tool_call: ToolCall,
@@ -449,7 +498,7 @@ class MMCAAgent:
         for tool_call in tool_results:
             if tool_call.result:
                 context_parts.append(
-                    f"Kết quả từ {tool_call.tool_name}:\n{json.dumps(tool_call.result, ensure_ascii=False, indent=2)}"
+                    f"Kết quả từ {tool_call.tool_name}:\n{dump_json(tool_call.result, indent=True)}"
                 )
 
         context = "\n\n".join(context_parts) if context_parts else "Không tìm thấy kết quả phù hợp."
@@ -485,27 +534,8 @@ Nếu có lịch sử hội thoại, hãy cân nhắc ngữ cảnh trước đó
 
     def _extract_location(self, message: str) -> str | None:
         """Extract location name from message using pattern matching."""
-        known_locations = {
-            "mỹ khê": "My Khe Beach",
-            "my khe": "My Khe Beach",
-            "bãi biển mỹ khê": "My Khe Beach",
-            "cầu rồng": "Dragon Bridge",
-            "cau rong": "Dragon Bridge",
-            "dragon bridge": "Dragon Bridge",
-            "bà nà": "Ba Na Hills",
-            "ba na": "Ba Na Hills",
-            "bà nà hills": "Ba Na Hills",
-            "sơn trà": "Son Tra Peninsula",
-            "son tra": "Son Tra Peninsula",
-            "hội an": "Hoi An",
-            "hoi an": "Hoi An",
-            "ngũ hành sơn": "Marble Mountains",
-            "ngu hanh son": "Marble Mountains",
-            "marble mountains": "Marble Mountains",
-        }
-        
         message_lower = message.lower()
-        for pattern, location in known_locations.items():
+        for pattern, location in KNOWN_LOCATIONS.items():
             if pattern in message_lower:
                 return location
         
@@ -513,17 +543,8 @@ Nếu có lịch sử hội thoại, hãy cân nhắc ngữ cảnh trước đó
 
     def _extract_category(self, message: str) -> str | None:
         """Extract place category from message."""
-        categories = {
-            "cafe": ["cafe", "cà phê", "coffee"],
-            "restaurant": ["nhà hàng", "quán ăn", "restaurant", "ăn"],
-            "beach": ["bãi biển", "beach", "biển"],
-            "attraction": ["điểm tham quan", "du lịch", "attraction"],
-            "hotel": ["khách sạn", "hotel", "lưu trú"],
-            "bar": ["bar", "pub", "quán bar"],
-        }
-
         message_lower = message.lower()
-        for category, keywords in categories.items():
+        for category, keywords in PLACE_CATEGORIES.items():
             if any(kw in message_lower for kw in keywords):
                 return category
 
@@ -8,23 +8,23 @@ Implements the ReAct (Reasoning + Acting) pattern:
 """
 
 import time
-import json
-import re
 from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agent.state import AgentState, ReActStep
 from app.agent.reasoning import (
+    JSON_CODE_BLOCK_PATTERN,
     REACT_SYSTEM_PROMPT,
     parse_reasoning_response,
     build_reasoning_prompt,
     get_tool_purpose,
 )
 from app.mcp.tools import mcp_tools
-from app.shared.integrations.gemini_client import GeminiClient
-from app.shared.integrations.megallm_client import MegaLLMClient
-from app.shared.logger import agent_logger, AgentWorkflow, WorkflowStep
+from app.shared.integrations.gemini_client import get_gemini_client
+from app.shared.integrations.megallm_client import get_megallm_client
+from app.shared.logger import agent_logger, dump_json, AgentWorkflow, WorkflowStep
 
 
 # Default coordinates for Da Nang
@@ -55,9 +55,9 @@ class ReActAgent:
         
         # Initialize LLM client
         if provider == "Google":
-            self.llm_client = GeminiClient(model=model)
+            self.llm_client = get_gemini_client(model)
         else:
-            self.llm_client = MegaLLMClient(model=model)
+            self.llm_client = get_megallm_client(model)
         
         agent_logger.workflow_step(
             "ReAct Agent initialized",
@@ -111,7 +111,7 @@ class ReActAgent:
                 )
                 agent_logger.workflow_step(
                     f"Step {step_number} Action",
-                    f"{reasoning.action} → {json.dumps(reasoning.action_input, ensure_ascii=False)[:80]}"
+                    f"{reasoning.action} → {dump_json(reasoning.action_input)[:80]}"
                 )
                 
                 # Step 2: Check if done
@@ -126,6 +126,19 @@ class ReActAgent:
                     ))
                     break
                 
+                # Repeating the previous call verbatim can't yield new
+                # observations; stop and synthesize from what we have
+                if state.steps and (
+                    state.steps[-1].action == reasoning.action
+                    and state.steps[-1].action_input == reasoning.action_input
+                ):
+                    agent_logger.workflow_step(
+                        f"Step {step_number} Skipped",
+                        f"Repeated {reasoning.action} with same input, finishing early",
+                    )
+                    state.is_complete = True
+                    break
+                
                 # Step 3: Execute tool
                 observation = await self._execute_tool(
                     reasoning.action,
@@ -308,7 +321,7 @@ class ReActAgent:
         for step in state.steps:
             if step.observation and step.action != "finish":
                 context_parts.append(
-                    f"Kết quả từ {step.action}:\n{json.dumps(step.observation, ensure_ascii=False, indent=2)}"
+                    f"Kết quả từ {step.action}:\n{dump_json(step.observation, indent=True)}"
                 )
                 # Collect place_ids from observations
                 if isinstance(step.observation, list):
@@ -358,7 +371,7 @@ Chỉ chọn những place_id xuất hiện trong kết quả tìm kiếm ở tr
         # Parse JSON response
         try:
             # Extract JSON from response
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
+            json_match = JSON_CODE_BLOCK_PATTERN.search(response)
             if json_match:
                 response = json_match.group(1)
             
@@ -367,7 +380,7 @@ Chỉ chọn những place_id xuất hiện trong kết quả tìm kiếm ở tr
             if json_start != -1 and json_end != -1:
                 response = response[json_start:json_end + 1]
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             text_response = data.get("response", response)
             selected_ids = data.get("selected_place_ids", [])
             
@@ -376,7 +389,7 @@ Chỉ chọn những place_id xuất hiện trong kết quả tìm kiếm ở tr
             
             return text_response, valid_ids
             
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             # Fallback: return raw response with no places
             agent_logger.error("Failed to parse synthesis JSON", None)
             return response, []
@@ -56,6 +56,11 @@ Với mỗi bước, bạn phải:
 """
 
 
+# Patterns for pulling JSON out of LLM responses, compiled once at import
+JSON_CODE_BLOCK_PATTERN = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_THOUGHT_PATTERN = re.compile(r'"thought"\s*:\s*"([^"]*)"')
+_ACTION_PATTERN = re.compile(r'"action"\s*:\s*"([^"]*)"')
+
 
 @dataclass
 class ReasoningResult:
@@ -80,7 +85,7 @@ def parse_reasoning_response(response: str) -> ReasoningResult:
     raw = response.strip()
     
     # Try to extract JSON from code blocks
-    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw, re.DOTALL)
+    json_match = JSON_CODE_BLOCK_PATTERN.search(raw)
     if json_match:
         raw = json_match.group(1)
     
@@ -102,8 +107,8 @@ def parse_reasoning_response(response: str) -> ReasoningResult:
         agent_logger.error(f"Failed to parse reasoning response", e)
         
         # Fallback: try to extract key fields with regex
-        thought_match = re.search(r'"thought"\s*:\s*"([^"]*)"', raw)
-        action_match = re.search(r'"action"\s*:\s*"([^"]*)"', raw)
+        thought_match = _THOUGHT_PATTERN.search(raw)
+        action_match = _ACTION_PATTERN.search(raw)
         
         thought = thought_match.group(1) if thought_match else "Parse error"
         action = action_match.group(1) if action_match else "finish"
@@ -3,6 +3,7 @@
 from enum import Enum
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, Depends, UploadFile, File, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agent.mmca_agent import MMCAAgent
@@ -11,6 +12,7 @@ from app.shared.db.session import get_db
 from app.core.config import settings
 from app.mcp.tools import mcp_tools
 from app.shared.chat_history import chat_history
+from app.shared.uploads import read_upload_limited
 
 
 router = APIRouter()
@@ -200,7 +202,7 @@ This endpoint directly tests the `find_nearby_places` MCP tool.
 - Case 2: lat=16.0623184, lng=108.2306049, max_distance_km=17.94
 """,
 )
-async def find_nearby(request: NearbyRequest) -> NearbyResponse:
+async def find_nearby(request: NearbyRequest) -> ORJSONResponse:
     """
     Find nearby places using Neo4j graph database.
 
@@ -214,28 +216,32 @@ async def find_nearby(request: NearbyRequest) -> NearbyResponse:
         limit=request.limit,
     )
 
-    return NearbyResponse(
-        places=[
-            PlaceResponse(
-                place_id=p.place_id,
-                name=p.name,
-                category=p.category,
-                lat=p.lat,
-                lng=p.lng,
-                distance_km=p.distance_km,
-                rating=p.rating,
-                description=p.description,
-            )
-            for p in places
-        ],
-        count=len(places),
-        query={
+    # Data comes from our own graph query, so skip Pydantic entirely: build
+    # the NearbyResponse shape as plain dicts and let orjson emit them.
+    # response_model is kept for the OpenAPI schema.
+    items = [
+        {
+            "place_id": p.place_id,
+            "name": p.name,
+            "category": p.category,
+            "lat": p.lat,
+            "lng": p.lng,
+            "distance_km": p.distance_km,
+            "rating": p.rating,
+            "description": p.description,
+        }
+        for p in places
+    ]
+    return ORJSONResponse({
+        "places": items,
+        "count": len(items),
+        "query": {
             "lat": request.lat,
             "lng": request.lng,
             "max_distance_km": request.max_distance_km,
             "category": request.category,
         },
-    )
+    })
 
 
 async def enrich_places_from_ids(place_ids: list[str], db: AsyncSession) -> list[PlaceItem]:
@@ -251,6 +257,9 @@ async def enrich_places_from_ids(place_ids: list[str], db: AsyncSession) -> list
     """
     if not place_ids:
         return []
+
+    # Drop repeated ids (keeping first-seen order) before querying
+    place_ids = list(dict.fromkeys(place_ids))
     
     # Fetch full details from DB
     from sqlalchemy import text
@@ -266,20 +275,23 @@ async def enrich_places_from_ids(place_ids: list[str], db: AsyncSession) -> list
     )
     rows = result.fetchall()
     
-    # Build PlaceItem list preserving LLM order
+    # Build PlaceItem list preserving LLM order. Rows are already typed by the
+    # DB driver, so model_construct skips redundant per-field validation.
     places_dict = {row.place_id: row for row in rows}
     places = []
     for pid in place_ids:
         if pid in places_dict:
             row = places_dict[pid]
-            places.append(PlaceItem(
+            places.append(PlaceItem.model_construct(
                 place_id=row.place_id,
                 name=row.name,
                 category=row.category,
                 lat=row.lat,
                 lng=row.lng,
                 rating=float(row.rating) if row.rating else None,
+                distance_km=None,
                 address=row.address,
+                image_url=None,
             ))
     
     return places
@@ -358,10 +370,6 @@ async def chat(
             history=history,
         )
         
-        # Convert state to workflow
-        workflow = agent.to_workflow(agent_state)
-        workflow_data = workflow.to_dict()
-        
         # Add assistant response to history
         chat_history.add_message(
             user_id=request.user_id,
@@ -408,8 +416,9 @@ async def chat(
         # Extract places from tool results if available
         places = []
         if result.tool_results:
-            # Extract place_ids from ToolCall objects
-            place_ids = []
+            # Extract place_ids from ToolCall objects (insertion-ordered dict
+            # for O(1) de-duplication)
+            place_ids: dict[str, None] = {}
             distance_map = {}  # Store distance info for nearby places
             for tool_call in result.tool_results:
                 # ToolCall has .result attribute which is a list of dicts
@@ -417,14 +426,13 @@ async def chat(
                     for item in tool_call.result:
                         if isinstance(item, dict) and 'place_id' in item:
                             pid = item['place_id']
-                            if pid not in place_ids:  # Avoid duplicates
-                                place_ids.append(pid)
+                            place_ids.setdefault(pid)
                             # Capture distance if available (from find_nearby_places)
                             if 'distance_km' in item:
                                 distance_map[pid] = item['distance_km']
             
             if place_ids:
-                places = await enrich_places_from_ids(place_ids[:5], db)  # Limit to top 5
+                places = await enrich_places_from_ids(list(place_ids)[:5], db)  # Limit to top 5
                 # Add distance info to places
                 for place in places:
                     if place.place_id in distance_map:
@@ -496,7 +504,7 @@ async def get_chat_messages(
         user_id=user_id,
         session_id=session_id,
         messages=[
-            MessageItem(
+            MessageItem.model_construct(
                 role=m.role,
                 content=m.content,
                 timestamp=m.timestamp.isoformat(),
@@ -540,18 +548,19 @@ async def search_by_image(
     image: UploadFile = File(..., description="Image file to search"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
     db: AsyncSession = Depends(get_db),
-) -> ImageSearchResponse:
+) -> ORJSONResponse:
     """
     Search places by uploading an image.
 
     Uses visual embeddings to find similar places.
     """
     try:
-        # Read image bytes
-        image_bytes = await image.read()
-
-        if len(image_bytes) > 10 * 1024 * 1024:  # 10MB limit
-            raise HTTPException(status_code=400, detail="Image too large (max 10MB)")
+        # Read image bytes in chunks, aborting early past the 10MB limit
+        image_bytes = await read_upload_limited(
+            image,
+            max_bytes=10 * 1024 * 1024,
+            detail="Image too large (max 10MB)",
+        )
 
         # Search using visual tool
         results = await mcp_tools.search_by_image_bytes(
@@ -560,21 +569,20 @@ async def search_by_image(
             limit=limit,
         )
 
-        return ImageSearchResponse(
-            results=[
-                ImageSearchResult(
-                    place_id=r.place_id,
-                    name=r.name,
-                    category=r.category,
-                    rating=r.rating,
-                    similarity=r.similarity,
-                    matched_images=r.matched_images,
-                    image_url=r.image_url,
-                )
-                for r in results
-            ],
-            total=len(results),
-        )
+        # Same shape as ImageSearchResponse, serialized without Pydantic
+        items = [
+            {
+                "place_id": r.place_id,
+                "name": r.name,
+                "category": r.category,
+                "rating": r.rating,
+                "similarity": r.similarity,
+                "matched_images": r.matched_images,
+                "image_url": r.image_url,
+            }
+            for r in results
+        ]
+        return ORJSONResponse({"results": items, "total": len(items)})
     except HTTPException:
         raise
     except Exception as e:
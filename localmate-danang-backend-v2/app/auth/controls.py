@@ -9,6 +9,7 @@ import jwt
 import os
 from uuid import uuid4
 from app.core.config import settings
+from app.shared.integrations.http_client import get_http_client
 
 # Google OAuth verification URL
 GOOGLE_VERIFY_URL = "https://www.googleapis.com/oauth2/v3/userinfo"
@@ -41,31 +42,31 @@ async def login_control(access_token: str, db: AsyncSession) -> dict:
         HTTPException: If token is invalid or verification fails
     """
     # Verify token with Google
-    async with httpx.AsyncClient() as client:
-        try:
-            # Get user info using access token
-            response = await client.get(
-                GOOGLE_VERIFY_URL,
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
+    client = get_http_client()
+    try:
+        # Get user info using access token
+        response = await client.get(
+            GOOGLE_VERIFY_URL,
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
             
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=401,
-                    detail="Invalid access token"
-                )
+        if response.status_code != 200:
+            raise HTTPException(
+                status_code=401,
+                detail="Invalid access token"
+            )
             
-            google_user_info = response.json()
+        google_user_info = response.json()
             
-            # Verify the token was issued for our client
-            # Note: For access tokens from Token Client, we trust Google's validation
-            # The token is already validated by Google if we get a 200 response
+        # Verify the token was issued for our client
+        # Note: For access tokens from Token Client, we trust Google's validation
+        # The token is already validated by Google if we get a 200 response
             
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to verify token with Google: {str(e)}"
-            )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to verify token with Google: {str(e)}"
+        )
     
     # Extract user info from Google response
     email = google_user_info.get("email")
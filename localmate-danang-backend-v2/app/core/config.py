@@ -16,6 +16,13 @@ class Settings(BaseSettings):
     supabase_service_role_key: str
     database_url: str
 
+    # Database connection pool (per worker process)
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
+    # Schema holding the pgvector types (Supabase usually uses "extensions")
+    db_vector_schema: str = "public"
+
     # Neo4j
     neo4j_uri: str
     neo4j_username: str
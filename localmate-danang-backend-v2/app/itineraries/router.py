@@ -340,7 +340,13 @@ async def add_stop(
         # Try to fetch from database (optional - don't fail if not found)
         try:
             place_result = await db.execute(
-                text("SELECT name, category, address, rating, lat, lng FROM places_metadata WHERE place_id = :place_id"),
+                text("""
+                    SELECT name, category, address, rating,
+                           ST_Y(coordinates::geometry) as lat,
+                           ST_X(coordinates::geometry) as lng
+                    FROM places_metadata
+                    WHERE place_id = :place_id
+                """),
                 {"place_id": request.place_id}
             )
             place_row = place_result.fetchone()
@@ -350,8 +356,8 @@ async def add_stop(
                     "category": place_row.category,
                     "address": place_row.address,
                     "rating": float(place_row.rating) if place_row.rating else None,
-                    "lat": float(place_row.lat) if place_row.lat else None,
-                    "lng": float(place_row.lng) if place_row.lng else None,
+                    "lat": float(place_row.lat) if place_row.lat is not None else None,
+                    "lng": float(place_row.lng) if place_row.lng is not None else None,
                 }
         except Exception as e:
             # Log but don't fail - snapshot is optional
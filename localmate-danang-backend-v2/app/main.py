@@ -4,9 +4,12 @@ LocalMate Da Nang V2 - Multi-Modal Contextual Agent API.
 FastAPI application entry point with /chat endpoint for testing.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import router as api_router
@@ -16,6 +19,45 @@ from app.itineraries.router import router as itineraries_router
 from app.auth.router import router as auth_router
 from app.shared.db.session import engine
 from app.shared.integrations.neo4j_client import neo4j_client
+from app.shared.integrations.http_client import close_http_client
+
+# Seconds between background Neo4j connectivity probes for /health
+HEALTH_PROBE_INTERVAL = 5.0
+
+# Static response bodies, serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "name": "LocalMate Da Nang V2 - MMCA API",
+    "version": "0.2.0",
+    "docs": "/docs",
+    "description": "Multi-Modal Contextual Agent for Da Nang Tourism",
+})
+_HEALTH_BODIES = {
+    ok: orjson.dumps({
+        "status": "healthy",
+        "version": "0.2.0",
+        "services": {
+            "neo4j": "connected" if ok else "disconnected",
+        },
+    })
+    for ok in (True, False)
+}
+
+# Latest background probe result, read by /health
+_neo4j_ok = False
+
+
+async def _probe_neo4j() -> bool:
+    """Check Neo4j connectivity and record the result for /health."""
+    global _neo4j_ok
+    _neo4j_ok = await neo4j_client.verify_connectivity()
+    return _neo4j_ok
+
+
+async def _probe_neo4j_periodically() -> None:
+    """Refresh Neo4j status out of the request path."""
+    while True:
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+        await _probe_neo4j()
 
 
 @asynccontextmanager
@@ -29,10 +71,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ SigLIP not loaded (image search disabled): {e}")
     
+    # Startup - open the first Neo4j connection so the pool is warm
+    neo4j_ok = await _probe_neo4j()
+    print(f"{'✅' if neo4j_ok else '⚠️'} Neo4j connected: {neo4j_ok}")
+    probe_task = asyncio.create_task(_probe_neo4j_periodically())
+    
     yield
     
     # Shutdown
+    probe_task.cancel()
     await neo4j_client.close()
+    await close_http_client()
+    try:
+        from app.shared.integrations.siglip_client import close_siglip_client
+        close_siglip_client()
+    except ImportError:
+        pass  # SigLIP dependencies not installed, nothing to close
     await engine.dispose()
 
 
@@ -60,6 +114,7 @@ Intelligent travel assistant for Da Nang with 3 MCP tools + Trip Planner:
 """,
     version="0.3.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware - allow all for demo
@@ -88,24 +143,13 @@ async def health_check():
     """
     Health check endpoint.
 
-    Returns status of the application and connected services.
+    Returns status of the application and connected services. Neo4j status
+    comes from a background probe, so this never touches the database.
     """
-    neo4j_ok = await neo4j_client.verify_connectivity()
-    return {
-        "status": "healthy",
-        "version": "0.2.0",
-        "services": {
-            "neo4j": "connected" if neo4j_ok else "disconnected",
-        },
-    }
+    return Response(content=_HEALTH_BODIES[_neo4j_ok], media_type="application/json")
 
 
 @app.get("/", tags=["System"])
 async def root():
     """Root endpoint with API info."""
-    return {
-        "name": "LocalMate Da Nang V2 - MMCA API",
-        "version": "0.2.0",
-        "docs": "/docs",
-        "description": "Multi-Modal Contextual Agent for Da Nang Tourism",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
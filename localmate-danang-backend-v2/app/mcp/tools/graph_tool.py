@@ -7,15 +7,18 @@ Features:
 - OpenStreetMap geocoding fallback
 """
 
+import math
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-import httpx
+from neo4j import Query
 
+from app.shared.cache import TTLCache
+from app.shared.integrations.http_client import get_http_client
 from app.shared.integrations.neo4j_client import neo4j_client
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceResult:
     """Result from nearby places search."""
 
@@ -29,7 +32,7 @@ class PlaceResult:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NearbyPlace:
     """Nearby place with distance."""
 
@@ -40,7 +43,7 @@ class NearbyPlace:
     distance_km: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """Place review."""
 
@@ -49,7 +52,7 @@ class Review:
     reviewer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaceDetails:
     """Complete place details from Neo4j."""
 
@@ -73,6 +76,160 @@ class PlaceDetails:
     same_category: list[dict[str, Any]] = field(default_factory=list)
 
 
+# Graph data changes rarely; short TTLs keep hot lookups off Neo4j
+_place_cache = TTLCache(maxsize=2048, ttl=300)
+_nearby_cache = TTLCache(maxsize=4096, ttl=120)
+# Landmark coordinates don't move; resolved names skip Neo4j and Nominatim
+_coords_cache = TTLCache(maxsize=1024, ttl=3600)
+
+# Kilometers per degree of latitude (and of longitude at the equator)
+KM_PER_DEGREE = 111.32
+
+# Default radius for NEAR relationships used in place details
+NEAR_MAX_DISTANCE_KM = 2.0
+
+# Photos / reviews returned with place details (limited inside Cypher)
+DETAILS_PHOTOS_LIMIT = 10
+DETAILS_REVIEWS_LIMIT = 5
+
+
+# Server-side cap for graph queries (seconds); a pathological plan fails fast
+# instead of holding a pooled connection
+QUERY_TIMEOUT = 2.0
+
+# Cypher statements are built once at import and only parameters vary per
+# call, so hot paths send the same text and Neo4j reuses the cached plan.
+# The bounding box is a cheap seek on the Place(location) point index (see
+# scripts/create_indexes.py); exact distances are only computed inside it.
+# Places without a backfilled location fall back to latitude/longitude.
+_Q_NEARBY = Query("""
+CALL {
+    MATCH (p:Place)
+    WHERE point.withinBBox(
+        p.location,
+        point({latitude: $min_lat, longitude: $min_lng}),
+        point({latitude: $max_lat, longitude: $max_lng})
+    )
+    RETURN p
+    UNION
+    MATCH (p:Place)
+    WHERE p.location IS NULL
+      AND p.latitude >= $min_lat AND p.latitude <= $max_lat
+      AND p.longitude >= $min_lng AND p.longitude <= $max_lng
+    RETURN p
+}
+WITH p, point.distance(
+    coalesce(p.location, point({latitude: p.latitude, longitude: p.longitude})),
+    point({latitude: $lat, longitude: $lng})
+) / 1000 as distance_km
+WHERE distance_km <= $max_distance
+  AND ($category IS NULL OR toLower(p.category) CONTAINS toLower($category))
+RETURN
+    p.id as place_id,
+    p.name as name,
+    p.category as category,
+    p.latitude as lat,
+    p.longitude as lng,
+    distance_km,
+    p.rating as rating,
+    p.description as description
+ORDER BY distance_km
+LIMIT $limit
+""", timeout=QUERY_TIMEOUT)
+
+# Place, photos, reviews, nearby and same-category in one round-trip.
+# Project only the properties PlaceDetails uses instead of shipping the
+# whole node over Bolt.
+_Q_PLACE_DETAILS = Query("""
+MATCH (p:Place {id: $place_id})
+CALL {
+    WITH p
+    MATCH (p)-[:HAS_PHOTO]->(photo:Photo)
+    WITH DISTINCT photo.path as path
+    LIMIT $photos_limit
+    RETURN collect(path) as photos
+}
+CALL {
+    WITH p
+    MATCH (p)-[:HAS_REVIEW]->(review:Review)
+    WHERE review.text IS NOT NULL AND review.text <> ''
+    WITH DISTINCT review.text as text, review.rating as rating, review.reviewer as reviewer
+    LIMIT $reviews_limit
+    RETURN collect({text: text, rating: rating, reviewer: reviewer}) as reviews
+}
+CALL {
+    WITH p
+    MATCH (p)-[n:NEAR]-(other:Place)
+    WHERE $include_nearby AND n.distance_km <= $max_distance
+    WITH other, n
+    ORDER BY n.distance_km
+    LIMIT $limit
+    RETURN collect({
+        place_id: other.id,
+        name: other.name,
+        category: other.category,
+        rating: other.rating,
+        distance_km: n.distance_km
+    }) as nearby
+}
+CALL {
+    WITH p
+    MATCH (p)-[:IN_CATEGORY]->(c:Category)<-[:IN_CATEGORY]-(other:Place)
+    WHERE $include_same_category AND other.id <> $place_id
+    WITH other
+    ORDER BY other.rating DESC
+    LIMIT $limit
+    RETURN collect({
+        place_id: other.id,
+        name: other.name,
+        category: other.category,
+        rating: other.rating,
+        address: other.address
+    }) as same_category
+}
+RETURN p {
+           .id, .name, .category, .rating, .address, .phone, .website,
+           .google_maps_url, .description, .specialty, .price_range,
+           .latitude, .longitude, .photos_count, .reviews_count
+       } as p,
+       photos,
+       reviews,
+       nearby,
+       same_category
+""", timeout=QUERY_TIMEOUT)
+
+_Q_NEAR_RELATIONSHIP = Query("""
+MATCH (p:Place {id: $place_id})-[n:NEAR]-(other:Place)
+WHERE n.distance_km <= $max_distance
+RETURN other.id as place_id,
+       other.name as name,
+       other.category as category,
+       other.rating as rating,
+       n.distance_km as distance_km
+ORDER BY n.distance_km
+LIMIT $limit
+""", timeout=QUERY_TIMEOUT)
+
+_Q_SAME_CATEGORY = Query("""
+MATCH (p:Place {id: $place_id})-[:IN_CATEGORY]->(c:Category)<-[:IN_CATEGORY]-(other:Place)
+WHERE other.id <> $place_id
+RETURN other.id as place_id,
+       other.name as name,
+       other.category as category,
+       other.rating as rating,
+       other.address as address
+ORDER BY other.rating DESC
+LIMIT $limit
+""", timeout=QUERY_TIMEOUT)
+
+_Q_BY_LOCATION = Query("""
+MATCH (p:Place)
+WHERE toLower(p.name) CONTAINS toLower($name)
+RETURN p.latitude as lat, p.longitude as lng
+LIMIT 1
+""", timeout=QUERY_TIMEOUT)
+
+
 # Available categories in Neo4j
 AVAILABLE_CATEGORIES = [
     "Asian restaurant", "Athletic club", "Badminton court", "Bakery", "Bar",
@@ -138,42 +295,30 @@ async def find_nearby_places(
     Returns:
         List of nearby places ordered by distance
     """
-    category_filter = ""
-    if category:
-        category_filter = "AND toLower(p.category) CONTAINS toLower($category)"
+    cache_key = (lat, lng, max_distance_km, category, limit)
+    cached = _nearby_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
 
-    query = f"""
-    MATCH (p:Place)
-    WITH p, point.distance(
-        point({{latitude: p.latitude, longitude: p.longitude}}),
-        point({{latitude: $lat, longitude: $lng}})
-    ) / 1000 as distance_km
-    WHERE distance_km <= $max_distance {category_filter}
-    RETURN 
-        p.id as place_id,
-        p.name as name,
-        p.category as category,
-        p.latitude as lat,
-        p.longitude as lng,
-        distance_km,
-        p.rating as rating,
-        p.description as description
-    ORDER BY distance_km
-    LIMIT $limit
-    """
+    # Degrees spanned by the radius; longitude degrees shrink with latitude
+    lat_delta = max_distance_km / KM_PER_DEGREE
+    lng_delta = max_distance_km / (KM_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
 
     params = {
         "lat": lat,
         "lng": lng,
+        "min_lat": lat - lat_delta,
+        "max_lat": lat + lat_delta,
+        "min_lng": lng - lng_delta,
+        "max_lng": lng + lng_delta,
         "max_distance": max_distance_km,
+        "category": category or None,
         "limit": limit,
     }
-    if category:
-        params["category"] = category
 
-    results = await neo4j_client.run_cypher(query, params)
+    results = await neo4j_client.run_cypher(_Q_NEARBY, params)
 
-    return [
+    places = [
         PlaceResult(
             place_id=r["place_id"],
             name=r["name"],
@@ -186,6 +331,8 @@ async def find_nearby_places(
         )
         for r in results
     ]
+    _nearby_cache.set(cache_key, places)
+    return list(places)
 
 
 async def get_place_details(
@@ -206,21 +353,20 @@ async def get_place_details(
     Returns:
         PlaceDetails or None if not found
     """
-    # Main place query with photos and reviews
-    query = """
-    MATCH (p:Place {id: $place_id})
-    OPTIONAL MATCH (p)-[:HAS_PHOTO]->(photo:Photo)
-    OPTIONAL MATCH (p)-[:HAS_REVIEW]->(review:Review)
-    RETURN p,
-           collect(DISTINCT photo.path) as photos,
-           collect(DISTINCT {
-               text: review.text,
-               rating: review.rating,
-               reviewer: review.reviewer
-           }) as reviews
-    """
+    cache_key = (place_id, include_nearby, include_same_category, nearby_limit)
+    cached = _place_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    results = await neo4j_client.run_cypher(query, {"place_id": place_id})
+    results = await neo4j_client.run_cypher(_Q_PLACE_DETAILS, {
+        "place_id": place_id,
+        "include_nearby": include_nearby,
+        "include_same_category": include_same_category,
+        "max_distance": NEAR_MAX_DISTANCE_KM,
+        "limit": nearby_limit,
+        "photos_limit": DETAILS_PHOTOS_LIMIT,
+        "reviews_limit": DETAILS_REVIEWS_LIMIT,
+    })
 
     if not results or not results[0].get('p'):
         return None
@@ -229,11 +375,11 @@ async def get_place_details(
     place = record['p']
 
     details = PlaceDetails(
-        place_id=place.get('id', place_id),
-        name=place.get('name', 'Unknown'),
-        category=place.get('category', ''),
+        place_id=place.get('id') or place_id,
+        name=place.get('name') or 'Unknown',
+        category=place.get('category') or '',
         rating=float(place.get('rating', 0) or 0),
-        address=place.get('address', ''),
+        address=place.get('address') or '',
         phone=place.get('phone'),
         website=place.get('website'),
         google_maps_url=place.get('google_maps_url'),
@@ -246,33 +392,49 @@ async def get_place_details(
         },
         photos_count=int(place.get('photos_count', 0) or 0),
         reviews_count=int(place.get('reviews_count', 0) or 0),
-        photos=record.get('photos', [])[:10],
+        photos=record.get('photos', []),
         reviews=[
             Review(
-                text=r['text'] or '',
+                text=r['text'],
                 rating=int(r['rating'] or 0),
                 reviewer=r['reviewer'] or ''
             )
-            for r in record.get('reviews', [])[:5]
-            if r.get('text')
-        ]
+            for r in record.get('reviews', [])
+        ],
+        nearby_places=[_to_nearby_place(r) for r in record.get('nearby', [])],
+        same_category=[_to_same_category(r) for r in record.get('same_category', [])],
     )
 
-    # Get nearby places
-    if include_nearby:
-        details.nearby_places = await get_nearby_by_relationship(place_id, nearby_limit)
+    _place_cache.set(cache_key, details)
+    return details
+
 
-    # Get same category places
-    if include_same_category:
-        details.same_category = await get_same_category_places(place_id, nearby_limit)
+def _to_nearby_place(r: dict) -> NearbyPlace:
+    """Build a NearbyPlace from a NEAR query record."""
+    return NearbyPlace(
+        place_id=r['place_id'],
+        name=r['name'],
+        category=r['category'] or '',
+        rating=float(r['rating'] or 0),
+        distance_km=round(float(r['distance_km'] or 0), 2)
+    )
 
-    return details
+
+def _to_same_category(r: dict) -> dict[str, Any]:
+    """Build a same-category place dict from an IN_CATEGORY query record."""
+    return {
+        'place_id': r['place_id'],
+        'name': r['name'],
+        'category': r['category'] or '',
+        'rating': float(r['rating'] or 0),
+        'address': r['address'] or ''
+    }
 
 
 async def get_nearby_by_relationship(
     place_id: str,
     limit: int = 5,
-    max_distance_km: float = 2.0
+    max_distance_km: float = NEAR_MAX_DISTANCE_KM
 ) -> list[NearbyPlace]:
     """
     Get places near a given place using NEAR relationship.
@@ -285,34 +447,13 @@ async def get_nearby_by_relationship(
     Returns:
         List of NearbyPlace objects
     """
-    query = """
-    MATCH (p:Place {id: $place_id})-[n:NEAR]-(other:Place)
-    WHERE n.distance_km <= $max_distance
-    RETURN other.id as place_id,
-           other.name as name,
-           other.category as category,
-           other.rating as rating,
-           n.distance_km as distance_km
-    ORDER BY n.distance_km
-    LIMIT $limit
-    """
-
-    results = await neo4j_client.run_cypher(query, {
+    results = await neo4j_client.run_cypher(_Q_NEAR_RELATIONSHIP, {
         "place_id": place_id,
         "max_distance": max_distance_km,
         "limit": limit
     })
 
-    return [
-        NearbyPlace(
-            place_id=r['place_id'],
-            name=r['name'],
-            category=r['category'] or '',
-            rating=float(r['rating'] or 0),
-            distance_km=round(float(r['distance_km'] or 0), 2)
-        )
-        for r in results
-    ]
+    return [_to_nearby_place(r) for r in results]
 
 
 async def get_same_category_places(
@@ -329,33 +470,12 @@ async def get_same_category_places(
     Returns:
         List of places in same category, ordered by rating
     """
-    query = """
-    MATCH (p:Place {id: $place_id})-[:IN_CATEGORY]->(c:Category)<-[:IN_CATEGORY]-(other:Place)
-    WHERE other.id <> $place_id
-    RETURN other.id as place_id,
-           other.name as name,
-           other.category as category,
-           other.rating as rating,
-           other.address as address
-    ORDER BY other.rating DESC
-    LIMIT $limit
-    """
-
-    results = await neo4j_client.run_cypher(query, {
+    results = await neo4j_client.run_cypher(_Q_SAME_CATEGORY, {
         "place_id": place_id,
         "limit": limit
     })
 
-    return [
-        {
-            'place_id': r['place_id'],
-            'name': r['name'],
-            'category': r['category'] or '',
-            'rating': float(r['rating'] or 0),
-            'address': r['address'] or ''
-        }
-        for r in results
-    ]
+    return [_to_same_category(r) for r in results]
 
 
 async def geocode_location(location_name: str, country: str = "Vietnam") -> tuple[float, float] | None:
@@ -372,26 +492,27 @@ async def geocode_location(location_name: str, country: str = "Vietnam") -> tupl
     search_query = f"{location_name}, Da Nang, {country}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://nominatim.openstreetmap.org/search",
-                params={
-                    "q": search_query,
-                    "format": "json",
-                    "limit": 1,
-                    "addressdetails": 0,
-                },
-                headers={
-                    "User-Agent": "LocalMate-DaNang/1.0 (travel assistant app)",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            "https://nominatim.openstreetmap.org/search",
+            params={
+                "q": search_query,
+                "format": "json",
+                "limit": 1,
+                "addressdetails": 0,
+            },
+            headers={
+                "User-Agent": "LocalMate-DaNang/1.0 (travel assistant app)",
+            },
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            if data and len(data) > 0:
-                lat = float(data[0]["lat"])
-                lng = float(data[0]["lon"])
-                return (lat, lng)
+        if data and len(data) > 0:
+            lat = float(data[0]["lat"])
+            lng = float(data[0]["lon"])
+            return (lat, lng)
 
     except Exception:
         pass
@@ -411,23 +532,27 @@ async def get_location_coordinates(location_name: str) -> tuple[float, float] |
     Returns:
         (lat, lng) tuple or None if not found
     """
+    # Only successful lookups are cached, so a transient Neo4j/OSM failure
+    # isn't remembered as "not found"
+    cache_key = " ".join(location_name.lower().split())
+    cached = _coords_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Try Neo4j first
     try:
-        query = """
-        MATCH (p:Place)
-        WHERE toLower(p.name) CONTAINS toLower($name)
-        RETURN p.latitude as lat, p.longitude as lng
-        LIMIT 1
-        """
-        results = await neo4j_client.run_cypher(query, {"name": location_name})
+        results = await neo4j_client.run_cypher(_Q_BY_LOCATION, {"name": location_name})
         if results and results[0].get("lat") and results[0].get("lng"):
-            return (results[0]["lat"], results[0]["lng"])
+            coords = (results[0]["lat"], results[0]["lng"])
+            _coords_cache.set(cache_key, coords)
+            return coords
     except Exception:
         pass
 
     # Fallback to OpenStreetMap Nominatim
     osm_result = await geocode_location(location_name)
     if osm_result:
+        _coords_cache.set(cache_key, osm_result)
         return osm_result
 
     return None
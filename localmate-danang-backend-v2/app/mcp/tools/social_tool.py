@@ -1,10 +1,31 @@
 
 import os
-import httpx
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
-@dataclass
+from app.shared.integrations.http_client import get_http_client
+
+# Friendly platform name -> Brave site: operators
+PLATFORM_SITES = {
+    "facebook": ("site:facebook.com",),
+    "reddit": ("site:reddit.com",),
+    "twitter": ("site:twitter.com", "site:x.com"),
+    "x": ("site:twitter.com", "site:x.com"),
+    "linkedin": ("site:linkedin.com",),
+    "tiktok": ("site:tiktok.com",),
+    "instagram": ("site:instagram.com",),
+}
+
+# Result domain -> platform label when Brave gives no profile name
+DOMAIN_PLATFORMS = {
+    "reddit.com": "Reddit",
+    "twitter.com": "X (Twitter)",
+    "x.com": "X (Twitter)",
+    "facebook.com": "Facebook",
+}
+
+
+@dataclass(slots=True)
 class SocialSearchResult:
     title: str
     url: str
@@ -55,13 +76,16 @@ class BraveSocialSearch:
             social_sites = []
             for p in platforms:
                 p = p.lower()
-                if "facebook" in p: social_sites.append("site:facebook.com")
-                elif "reddit" in p: social_sites.append("site:reddit.com")
-                elif "twitter" in p or "x" == p: social_sites.extend(["site:twitter.com", "site:x.com"])
-                elif "linkedin" in p: social_sites.append("site:linkedin.com")
-                elif "tiktok" in p: social_sites.append("site:tiktok.com")
-                elif "instagram" in p: social_sites.append("site:instagram.com")
-                elif "site:" in p: social_sites.append(p) # Direct operator
+                sites = PLATFORM_SITES.get(p)  # Exact name (the common case)
+                if sites is None:
+                    sites = next(
+                        (s for name, s in PLATFORM_SITES.items() if name != "x" and name in p),
+                        None,
+                    )
+                if sites:
+                    social_sites.extend(sites)
+                elif "site:" in p:
+                    social_sites.append(p)  # Direct operator
         
         # Construct query with site OR operator
         if len(social_sites) > 1:
@@ -83,46 +107,45 @@ class BraveSocialSearch:
             "spellcheck": 1
         }
         
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    self.BASE_URL, 
-                    headers=headers, 
-                    params=params, 
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                data = response.json()
+        client = get_http_client()
+        try:
+            response = await client.get(
+                self.BASE_URL, 
+                headers=headers, 
+                params=params, 
+                timeout=10.0
+            )
+            response.raise_for_status()
+            data = response.json()
                 
-                results = []
+            results = []
                 
-                # Parse 'web' results (most common)
-                if "web" in data and "results" in data["web"]:
-                    for item in data["web"]["results"]:
-                        # Extract platform from profile or url
-                        platform = "Web"
-                        if "profile" in item and "name" in item["profile"]:
-                            platform = item["profile"]["name"]
-                        else:
-                            # Simple heuristic
-                            domain = item.get("url", "").split("//")[-1].split("/")[0]
-                            if "reddit" in domain: platform = "Reddit"
-                            elif "twitter" in domain or "x.com" in domain: platform = "X (Twitter)"
-                            elif "facebook" in domain: platform = "Facebook"
+            # Parse 'web' results (most common)
+            if "web" in data and "results" in data["web"]:
+                for item in data["web"]["results"]:
+                    # Extract platform from profile or url
+                    platform = "Web"
+                    if "profile" in item and "name" in item["profile"]:
+                        platform = item["profile"]["name"]
+                    else:
+                        # Simple heuristic
+                        domain = item.get("url", "").split("//")[-1].split("/")[0]
+                        # Registered domain (e.g. old.reddit.com -> reddit.com)
+                        platform = DOMAIN_PLATFORMS.get(".".join(domain.lower().rsplit(".", 2)[-2:]), "Web")
                             
-                        results.append(SocialSearchResult(
-                            title=item.get("title", ""),
-                            url=item.get("url", ""),
-                            description=item.get("description", ""),
-                            age=item.get("age", ""),
-                            platform=platform
-                        ))
+                    results.append(SocialSearchResult(
+                        title=item.get("title", ""),
+                        url=item.get("url", ""),
+                        description=item.get("description", ""),
+                        age=item.get("age", ""),
+                        platform=platform
+                    ))
                         
-                return results
+            return results
                 
-            except Exception as e:
-                print(f"Error calling Brave Search API: {e}")
-                return []
+        except Exception as e:
+            print(f"Error calling Brave Search API: {e}")
+            return []
 
 # Singleton instance
 social_search_tool = BraveSocialSearch()
@@ -4,6 +4,7 @@ Schema: place_text_embeddings (place_id, embedding, content_type, source_text, m
         places_metadata (place_id, name, category, rating, raw_data)
 """
 
+import re
 from dataclasses import dataclass, field
 from collections import defaultdict
 from typing import Optional
@@ -14,7 +15,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.integrations.embedding_client import embedding_client
 
 
-@dataclass
+# Nearest text chunks fetched before collapsing to one row per place
+MATCH_CANDIDATES = 200
+
+
+@dataclass(slots=True)
 class TextSearchResult:
     """Result from text context search."""
 
@@ -53,6 +58,15 @@ CATEGORY_TO_DB = {
     'korean': ['Korean restaurant', 'Korean barbecue restaurant'],
 }
 
+# All category keywords in one alternation, one named group per category
+_CATEGORY_PATTERN = re.compile(
+    '|'.join(
+        f"(?P<{category}>{'|'.join(re.escape(kw) for kw in keywords)})"
+        for category, keywords in CATEGORY_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
 
 # Tool definition for agent
 TOOL_DEFINITION = {
@@ -74,10 +88,11 @@ Hỗ trợ: Vietnamese + English""",
 
 def detect_category_intent(query: str) -> Optional[str]:
     """Detect if query is asking for specific category."""
-    query_lower = query.lower()
-
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        if any(kw in query_lower for kw in keywords):
+    # One scan over the query; when several categories match, the one listed
+    # first in CATEGORY_KEYWORDS wins
+    matched = {m.lastgroup for m in _CATEGORY_PATTERN.finditer(query)}
+    for category in CATEGORY_KEYWORDS:
+        if category in matched:
             return category
     return None
 
@@ -104,70 +119,82 @@ async def retrieve_context_text(
     """
     # Generate embedding for query
     query_embedding = await embedding_client.embed_text(query)
-    
-    # Convert to PostgreSQL vector format
-    embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
 
     # Detect category intent for boosting
     category_intent = detect_category_intent(query)
     category_filter = CATEGORY_TO_DB.get(category_intent, []) if category_intent else []
 
-    # Search with JOIN to places_metadata
-    # Note: Use format string for embedding since SQLAlchemy param binding 
-    # doesn't work correctly with ::vector type casting
-    sql = text(f"""
-        SELECT DISTINCT ON (e.place_id)
-            e.place_id,
-            e.content_type,
-            e.source_text,
-            1 - (e.embedding <=> '{embedding_str}'::vector) as similarity,
-            m.name,
-            m.category,
-            m.rating,
-            m.raw_data
-        FROM place_text_embeddings e
-        JOIN places_metadata m ON e.place_id = m.place_id
-        WHERE 1 - (e.embedding <=> '{embedding_str}'::vector) > :threshold
-          AND m.name IS NOT NULL 
-          AND m.name != ''
-        ORDER BY e.place_id, e.embedding <=> '{embedding_str}'::vector
+    # Half-precision inner-product HNSW index (scripts/create_indexes.py);
+    # embeddings are unit-norm, so `<#>` is negated cosine similarity.
+    # CAST(:embedding AS ...) because `::` clashes with SQLAlchemy's `:param`.
+    sql = text("""
+        WITH candidates AS (
+            SELECT
+                e.place_id,
+                e.content_type,
+                e.source_text,
+                CAST(e.embedding AS halfvec(768)) <#> CAST(:embedding AS halfvec(768)) as distance
+            FROM place_text_embeddings e
+            ORDER BY distance
+            LIMIT :candidates
+        )
+        SELECT
+            place_id,
+            content_type,
+            source_text,
+            name,
+            category,
+            rating,
+            description,
+            similarity
+                + CASE WHEN category = ANY(CAST(:categories AS text[])) THEN 0.15 ELSE 0 END
+                + CASE WHEN rating >= 4.5 THEN 0.05 WHEN rating >= 4.0 THEN 0.02 ELSE 0 END
+                as score
+        FROM (
+            SELECT DISTINCT ON (c.place_id)
+                c.place_id,
+                c.content_type,
+                LEFT(c.source_text, 300) as source_text,
+                -c.distance as similarity,
+                m.name,
+                m.category,
+                m.rating,
+                LEFT(m.raw_data->>'description', 300) as description
+            FROM candidates c
+            JOIN places_metadata m ON c.place_id = m.place_id
+            WHERE -c.distance > :threshold
+              AND m.name IS NOT NULL 
+              AND m.name != ''
+            ORDER BY c.place_id, c.distance
+        ) best
+        ORDER BY score DESC, place_id
+        LIMIT :limit
     """)
 
+    # Transaction-local probe size; HNSW returns at most ef_search rows
+    await db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(MATCH_CANDIDATES)},
+    )
+
     results = await db.execute(sql, {
+        "embedding": query_embedding,
+        "categories": category_filter,
         "threshold": threshold,
+        "candidates": MATCH_CANDIDATES,
+        "limit": limit,
     })
 
-    rows = results.fetchall()
-
-    # Process and score results with category boosting
-    scored_results = []
-    for r in rows:
-        score = float(r.similarity)
-        
-        # Category boost (15%)
-        if category_filter and r.category in category_filter:
-            score += 0.15
-        
-        # Rating boost (5% for >= 4.5)
-        if r.rating and r.rating >= 4.5:
-            score += 0.05
-        elif r.rating and r.rating >= 4.0:
-            score += 0.02
-        
-        raw_data = r.raw_data or {}
-        
-        scored_results.append((score, TextSearchResult(
+    return [
+        TextSearchResult(
             place_id=r.place_id,
             name=r.name or '',
             category=r.category or '',
             rating=float(r.rating) if r.rating else 0.0,
-            similarity=round(score, 4),
-            description=raw_data.get('description', '')[:300] if isinstance(raw_data, dict) else '',
-            source_text=r.source_text[:300] if r.source_text else '',
+            similarity=round(float(r.score), 4),
+            description=r.description or '',
+            source_text=r.source_text or '',
             content_type=r.content_type or '',
-        )))
-
-    # Sort by score and limit
-    scored_results.sort(key=lambda x: x[0], reverse=True)
-    
-    return [r for _, r in scored_results[:limit]]
+        )
+        for r in results.fetchall()
+    ]
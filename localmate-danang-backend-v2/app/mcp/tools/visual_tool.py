@@ -11,11 +11,14 @@ from typing import Optional
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
-from app.shared.integrations.siglip_client import get_siglip_client
 
+# Nearest images fetched before aggregating per place
+MATCH_CANDIDATES = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class ImageSearchResult:
     """Result from visual similarity search."""
 
@@ -51,6 +54,7 @@ async def retrieve_similar_visuals(
     image_bytes: bytes | None = None,
     limit: int = 10,
     threshold: float = 0.2,
+    ef_search: int | None = None,
 ) -> list[ImageSearchResult]:
     """
     Visual similarity search using local SigLIP embeddings.
@@ -63,91 +67,92 @@ async def retrieve_similar_visuals(
         image_bytes: Raw image bytes (alternative to URL)
         limit: Maximum results
         threshold: Minimum similarity threshold
+        ef_search: HNSW candidate list size (recall/latency knob). Defaults to
+            max(MATCH_CANDIDATES, limit * 4); an HNSW scan never returns more
+            than ef_search rows, so it must stay >= MATCH_CANDIDATES.
 
     Returns:
         List of places with visual similarity scores
     """
-    # Get SigLIP client (singleton)
+    # Get SigLIP client (singleton). Imported lazily so importing the MCP tools
+    # doesn't pull in numpy/PIL (and the model loader) until image search is used.
+    from app.shared.integrations.siglip_client import get_siglip_client
     siglip = get_siglip_client()
     
-    # Generate image embedding using local model
+    # Generate image embedding using local model. Decoding, the ViT forward
+    # pass and the URL download are blocking, so keep them off the event loop.
     if image_bytes:
-        image_embedding = siglip.embed_image_bytes(image_bytes)
+        image_embedding = await run_in_threadpool(siglip.embed_image_bytes, image_bytes)
     elif image_url:
-        image_embedding = siglip.embed_image_url(image_url)
+        image_embedding = await run_in_threadpool(siglip.embed_image_url, image_url)
     else:
         return []
 
     if image_embedding is None:
         return []
 
-    # Convert numpy array to PostgreSQL vector format
-    embedding_str = "[" + ",".join(str(x) for x in image_embedding.tolist()) + "]"
-
-    # Search with JOIN to places_metadata
-    sql = text(f"""
+    # SigLIP vectors are L2-normalized, so `<#>` on the halfvec index is the
+    # negated cosine similarity. Nearest images are aggregated per place in
+    # Postgres so only `limit` rows come back.
+    sql = text("""
+        WITH candidates AS (
+            SELECT 
+                e.place_id,
+                e.image_url,
+                CAST(e.embedding AS halfvec(768)) <#> CAST(:embedding AS halfvec(768)) as distance,
+                m.name,
+                m.category,
+                m.rating
+            FROM place_image_embeddings e
+            JOIN places_metadata m ON e.place_id = m.place_id
+            WHERE m.name IS NOT NULL 
+              AND m.name != ''
+            ORDER BY distance
+            LIMIT :candidates
+        ),
+        matches AS (
+            SELECT place_id, image_url, -distance as similarity, name, category, rating
+            FROM candidates
+            WHERE -distance > :threshold
+        )
         SELECT 
-            e.place_id,
-            e.image_url,
-            1 - (e.embedding <=> '{embedding_str}'::vector) as similarity,
-            m.name,
-            m.category,
-            m.rating
-        FROM place_image_embeddings e
-        JOIN places_metadata m ON e.place_id = m.place_id
-        WHERE 1 - (e.embedding <=> '{embedding_str}'::vector) > :threshold
-          AND m.name IS NOT NULL 
-          AND m.name != ''
-        ORDER BY e.embedding <=> '{embedding_str}'::vector
-        LIMIT 100
+            place_id,
+            name,
+            category,
+            rating,
+            AVG(similarity) as similarity,
+            COUNT(*) as matched_images,
+            (array_agg(image_url ORDER BY similarity DESC, image_url))[1] as best_image
+        FROM matches
+        GROUP BY place_id, name, category, rating
+        ORDER BY AVG(similarity) DESC, COUNT(*) DESC, place_id
+        LIMIT :limit
     """)
 
+    # ef_search applies to this transaction only
+    await db.execute(
+        text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+        {"ef_search": str(ef_search or max(MATCH_CANDIDATES, limit * 4))},
+    )
+
     results = await db.execute(sql, {
+        "embedding": image_embedding,
         "threshold": threshold,
+        "candidates": MATCH_CANDIDATES,
+        "limit": limit,
     })
 
-    rows = results.fetchall()
-
-    # Aggregate by place (multiple images per place)
-    place_scores: dict = {}
-
-    for r in rows:
-        pid = r.place_id
-
-        if pid not in place_scores:
-            place_scores[pid] = {
-                'total_score': 0.0,
-                'count': 0,
-                'data': r,
-                'best_image': r.image_url,
-            }
-
-        place_scores[pid]['total_score'] += float(r.similarity)
-        place_scores[pid]['count'] += 1
-        
-        # Keep best matching image
-        if float(r.similarity) > place_scores[pid]['total_score'] / place_scores[pid]['count']:
-            place_scores[pid]['best_image'] = r.image_url
-
-    # Sort by average similarity
-    sorted_places = sorted(
-        place_scores.items(),
-        key=lambda x: x[1]['total_score'] / x[1]['count'],
-        reverse=True
-    )[:limit]
-
-    # Build results
     return [
         ImageSearchResult(
-            place_id=pid,
-            name=data['data'].name or '',
-            category=data['data'].category or '',
-            rating=float(data['data'].rating or 0),
-            similarity=round(data['total_score'] / data['count'], 4),
-            matched_images=data['count'],
-            image_url=data['best_image'] or '',
+            place_id=r.place_id,
+            name=r.name or '',
+            category=r.category or '',
+            rating=float(r.rating or 0),
+            similarity=round(float(r.similarity), 4),
+            matched_images=r.matched_images,
+            image_url=r.best_image or '',
         )
-        for pid, data in sorted_places
+        for r in results.fetchall()
     ]
 
 
@@ -6,6 +6,8 @@ Uses Haversine formula for distance calculation.
 
 from math import radians, sin, cos, sqrt, atan2
 
+import numpy as np
+
 
 def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """
@@ -41,18 +43,22 @@ def calculate_distance_matrix(places: list[dict]) -> list[list[float]]:
     Returns:
         NxN matrix where matrix[i][j] is distance from place i to j
     """
-    n = len(places)
-    matrix = [[0.0] * n for _ in range(n)]
+    R = 6371  # Earth's radius in km
     
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                matrix[i][j] = haversine(
-                    places[i]['lat'], places[i]['lng'],
-                    places[j]['lat'], places[j]['lng']
-                )
+    # Haversine over all pairs at once on contiguous float arrays
+    lat = np.radians(np.fromiter((p['lat'] for p in places), dtype=np.float64, count=len(places)))
+    lng = np.radians(np.fromiter((p['lng'] for p in places), dtype=np.float64, count=len(places)))
+    
+    dlat = lat[:, None] - lat[None, :]
+    dlng = lng[:, None] - lng[None, :]
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlng / 2) ** 2
+    a = np.clip(a, 0.0, 1.0)
+    matrix = R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    np.fill_diagonal(matrix, 0.0)
     
-    return matrix
+    # Nested lists keep scalar indexing in the TSP loops fast
+    return matrix.tolist()
 
 
 def nearest_neighbor(matrix: list[list[float]], start: int = 0) -> list[int]:
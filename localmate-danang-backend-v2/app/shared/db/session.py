@@ -2,17 +2,38 @@
 
 from collections.abc import AsyncGenerator
 
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
-# Create async engine
+# Create async engine. Each pooled asyncpg connection keeps its own
+# prepared-statement cache, so the constant search SQL is parsed and
+# planned once per connection rather than on every request.
 engine = create_async_engine(
     settings.database_url,
     echo=False,  # Disable SQL logging (embedding vectors are too verbose)
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_vector_codec(dbapi_connection, connection_record):
+    """Register pgvector's binary codec so embeddings bind without text formatting."""
+    # Failing here would poison every pooled connection (auth, itineraries,
+    # ...), so only vector queries are affected if the types can't be found
+    try:
+        dbapi_connection.run_async(
+            lambda conn: register_vector(conn, schema=settings.db_vector_schema)
+        )
+    except Exception as e:
+        print(f"⚠️ pgvector codec not registered (schema '{settings.db_vector_schema}'): {e}")
+
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
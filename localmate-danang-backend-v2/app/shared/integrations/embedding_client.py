@@ -5,15 +5,21 @@ Supports:
 - Image: HuggingFace CLIP/SigLIP (512/768-dim)
 """
 
-import httpx
+import numpy as np
 from io import BytesIO
 from google import genai
 
 from app.core.config import settings
+from app.shared.cache import TTLCache
+from app.shared.integrations.http_client import get_http_client
 
 # Initialize Google GenAI client
 client = genai.Client(api_key=settings.google_api_key)
 
+# Query embeddings are deterministic for a given model, so repeated queries
+# can skip the embed_content round-trip (~3 KB per entry)
+_text_embedding_cache = TTLCache(maxsize=4096, ttl=3600)
+
 
 class EmbeddingClient:
     """Client for generating text and image embeddings."""
@@ -23,7 +29,7 @@ class EmbeddingClient:
         self.text_model = settings.embedding_model
         self.hf_api_key = settings.huggingface_api_key
 
-    async def embed_text(self, text: str) -> list[float]:
+    async def embed_text(self, text: str) -> np.ndarray:
         """
         Generate text embedding using text-embedding-004.
 
@@ -31,13 +37,25 @@ class EmbeddingClient:
             text: Text to embed
 
         Returns:
-            768-dimensional embedding vector
+            L2-normalized 768-dimensional embedding vector (float32), so
+            inner product equals cosine similarity
         """
-        response = client.models.embed_content(
+        # Whitespace-insensitive key so trivially different inputs share an entry
+        key = (self.text_model, " ".join(text.split()))
+        cached = _text_embedding_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await client.aio.models.embed_content(
             model=self.text_model,
             contents=text,
         )
-        return response.embeddings[0].values
+        embedding = np.asarray(response.embeddings[0].values, dtype=np.float32)
+        norm = np.sqrt(np.vdot(embedding, embedding))
+        if norm:
+            embedding /= norm
+        _text_embedding_cache.set(key, embedding)
+        return embedding
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
@@ -49,7 +67,7 @@ class EmbeddingClient:
         Returns:
             List of embedding vectors
         """
-        response = client.models.embed_content(
+        response = await client.aio.models.embed_content(
             model=self.text_model,
             contents=texts,
         )
@@ -69,17 +87,17 @@ class EmbeddingClient:
             return None
 
         try:
-            async with httpx.AsyncClient() as http_client:
-                # Use CLIP model via HuggingFace Inference API
-                response = await http_client.post(
-                    "https://api-inference.huggingface.co/models/openai/clip-vit-base-patch32",
-                    headers={"Authorization": f"Bearer {self.hf_api_key}"},
-                    json={"inputs": {"image": image_url}},
-                    timeout=30.0,
-                )
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            http_client = get_http_client()
+            # Use CLIP model via HuggingFace Inference API
+            response = await http_client.post(
+                "https://api-inference.huggingface.co/models/openai/clip-vit-base-patch32",
+                headers={"Authorization": f"Bearer {self.hf_api_key}"},
+                json={"inputs": {"image": image_url}},
+                timeout=30.0,
+            )
+            if response.status_code == 200:
+                return response.json()
+            return None
         except Exception:
             return None
 
@@ -102,16 +120,16 @@ class EmbeddingClient:
             b64_image = base64.b64encode(image_bytes).decode('utf-8')
             data_url = f"data:image/jpeg;base64,{b64_image}"
 
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.post(
-                    "https://api-inference.huggingface.co/models/openai/clip-vit-base-patch32",
-                    headers={"Authorization": f"Bearer {self.hf_api_key}"},
-                    json={"inputs": {"image": data_url}},
-                    timeout=30.0,
-                )
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            http_client = get_http_client()
+            response = await http_client.post(
+                "https://api-inference.huggingface.co/models/openai/clip-vit-base-patch32",
+                headers={"Authorization": f"Bearer {self.hf_api_key}"},
+                json={"inputs": {"image": data_url}},
+                timeout=30.0,
+            )
+            if response.status_code == 200:
+                return response.json()
+            return None
         except Exception:
             return None
 
@@ -2,14 +2,31 @@
 
 import json
 import re
+from functools import lru_cache
 
 from google import genai
+from google.genai import types
 
 from app.core.config import settings
 
 # Initialize Google GenAI client
 client = genai.Client(api_key=settings.google_api_key)
 
+# First flat JSON object in a model reply (tool-call parsing)
+_JSON_OBJECT_PATTERN = re.compile(r'\{[^{}]*\}', re.DOTALL)
+
+
+@lru_cache(maxsize=32)
+def _generation_config(
+    temperature: float,
+    system_instruction: str | None,
+) -> types.GenerateContentConfig:
+    """Build a generation config once per (temperature, system prompt) pair."""
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        system_instruction=system_instruction or None,
+    )
+
 
 class GeminiClient:
     """Client for Gemini LLM operations."""
@@ -35,14 +52,10 @@ class GeminiClient:
         Returns:
             Generated text response
         """
-        config = {"temperature": temperature}
-        if system_instruction:
-            config["system_instruction"] = system_instruction
-
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=self.model,
             contents=messages,
-            config=config,
+            config=_generation_config(temperature, system_instruction),
         )
         return response.text
 
@@ -63,14 +76,10 @@ class GeminiClient:
         Returns:
             Generated text
         """
-        config = {"temperature": temperature}
-        if system_instruction:
-            config["system_instruction"] = system_instruction
-
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model=self.model,
             contents=prompt,
-            config=config,
+            config=_generation_config(temperature, system_instruction),
         )
         return response.text
 
@@ -109,7 +118,7 @@ Nếu không cần gọi tool, trả về:
         response = await self.generate(prompt, temperature=0.3)
 
         try:
-            json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
+            json_match = _JSON_OBJECT_PATTERN.search(response)
             if json_match:
                 return json.loads(json_match.group())
             return json.loads(response)
@@ -117,11 +126,17 @@ Nếu không cần gọi tool, trả về:
             return {"tool_name": None, "arguments": {}, "reasoning": "Failed to parse"}
 
 
-def get_gemini_client(model: str | None = None) -> GeminiClient:
-    """Factory function to create Gemini client with specified model."""
+# Model names come from request input, so keep the per-model cache bounded
+@lru_cache(maxsize=8)
+def _cached_gemini_client(model: str) -> GeminiClient:
     return GeminiClient(model=model)
 
 
+def get_gemini_client(model: str | None = None) -> GeminiClient:
+    """Get the shared Gemini client for a model (created once per model)."""
+    return _cached_gemini_client(model or settings.default_gemini_model)
+
+
 # Global Gemini client instance (with default model)
-gemini_client = GeminiClient()
+gemini_client = get_gemini_client()
 
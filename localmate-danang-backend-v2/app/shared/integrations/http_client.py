@@ -0,0 +1,27 @@
+"""Shared HTTP client for outbound API calls (geocoding, search, OAuth, HF, MegaLLM)."""
+
+import httpx
+
+# Default timeout; callers can still pass timeout= per request
+DEFAULT_TIMEOUT = httpx.Timeout(10.0)
+
+# Shared connection pool so repeated calls to the same host reuse
+# keep-alive TLS connections instead of handshaking every request; HTTP/2
+# multiplexes concurrent requests to one host over a single connection
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or lazily create the shared AsyncClient."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, http2=True)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -1,8 +1,11 @@
 """MegaLLM client using OpenAI-compatible API with retry logic."""
 
+from functools import lru_cache
+
 import httpx
 
 from app.core.config import settings
+from app.shared.integrations.http_client import get_http_client
 
 # Timeout configuration for DeepSeek reasoning models (can take longer)
 REQUEST_TIMEOUT = httpx.Timeout(
@@ -52,22 +55,22 @@ class MegaLLMClient:
         last_error = None
         for attempt in range(max_retries + 1):
             try:
-                async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.api_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": messages,
-                            "temperature": temperature,
-                        },
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-                    return data["choices"][0]["message"]["content"]
+                response = await get_http_client().post(
+                    f"{self.base_url}/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": self.model,
+                        "messages": messages,
+                        "temperature": temperature,
+                    },
+                    timeout=REQUEST_TIMEOUT,
+                )
+                response.raise_for_status()
+                data = response.json()
+                return data["choices"][0]["message"]["content"]
             except httpx.ReadTimeout as e:
                 last_error = e
                 if attempt < max_retries:
@@ -110,24 +113,30 @@ class MegaLLMClient:
             content = msg.get("content") or msg.get("parts", [""])[0]
             chat_messages.append({"role": role, "content": content})
 
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": chat_messages,
-                    "temperature": temperature,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+        response = await get_http_client().post(
+            f"{self.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "messages": chat_messages,
+                "temperature": temperature,
+            },
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return data["choices"][0]["message"]["content"]
+
+
+# Model names come from request input, so keep the per-model cache bounded
+@lru_cache(maxsize=8)
+def _cached_megallm_client(model: str) -> MegaLLMClient:
+    return MegaLLMClient(model=model)
 
 
 def get_megallm_client(model: str | None = None) -> MegaLLMClient:
-    """Factory function to create MegaLLM client with specified model."""
-    return MegaLLMClient(model=model)
+    """Get the shared MegaLLM client for a model (created once per model)."""
+    return _cached_megallm_client(model or settings.default_megallm_model)
@@ -1,6 +1,6 @@
 """Neo4j client for graph database operations."""
 
-from neo4j import AsyncGraphDatabase
+from neo4j import AsyncGraphDatabase, Query, unit_of_work
 
 from app.core.config import settings
 
@@ -9,8 +9,13 @@ class Neo4jClient:
     """Async Neo4j client for spatial and graph queries."""
 
     def __init__(self, uri: str, user: str, password: str):
-        """Initialize Neo4j driver."""
-        self._driver = AsyncGraphDatabase.driver(uri, auth=(user, password))
+        """Initialize Neo4j driver with a shared connection pool."""
+        self._driver = AsyncGraphDatabase.driver(
+            uri,
+            auth=(user, password),
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=30,
+        )
 
     async def close(self) -> None:
         """Close the driver connection."""
@@ -18,22 +23,32 @@ class Neo4jClient:
 
     async def run_cypher(
         self,
-        query: str,
+        query: str | Query,
         params: dict | None = None,
     ) -> list[dict]:
         """
-        Execute a Cypher query and return results.
+        Execute a read-only Cypher query and return results.
+
+        Runs as a managed read transaction, so the driver can route it to a
+        reader and retry it on transient errors.
 
         Args:
-            query: Cypher query string
+            query: Cypher query string, or a Query whose timeout/metadata
+                are applied to the transaction
             params: Optional query parameters
 
         Returns:
             List of result records as dictionaries
         """
+        work = _read_records
+        if isinstance(query, Query):
+            # Managed transactions take the timeout from the unit of work,
+            # not from the Query object itself
+            work = unit_of_work(timeout=query.timeout, metadata=query.metadata)(_read_records)
+            query = query.text
+
         async with self._driver.session() as session:
-            result = await session.run(query, params or {})
-            return await result.data()
+            return await session.execute_read(work, query, params or {})
 
     async def verify_connectivity(self) -> bool:
         """Verify connection to Neo4j."""
@@ -44,6 +59,12 @@ class Neo4jClient:
             return False
 
 
+async def _read_records(tx, query: str, params: dict) -> list[dict]:
+    """Transaction function: run query and fetch all records as dicts."""
+    result = await tx.run(query, params)
+    return await result.data()
+
+
 # Global Neo4j client instance
 neo4j_client = Neo4jClient(
     settings.neo4j_uri,
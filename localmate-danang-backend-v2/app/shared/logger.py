@@ -8,11 +8,12 @@ Provides colored console logging with structured output for:
 """
 
 import logging
-import json
 import sys
 from datetime import datetime
 from typing import Any
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+import orjson
 
 
 # Configure root logger
@@ -36,6 +37,12 @@ COLORS = {
 }
 
 
+def dump_json(data: Any, indent: bool = False) -> str:
+    """Serialize tool data for prompts/logs with orjson (UTF-8, non-ASCII kept)."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(data, option=option, default=str).decode()
+
+
 def colorize(text: str, color: str) -> str:
     """Add color to text for terminal output."""
     return f"{COLORS.get(color, '')}{text}{COLORS['RESET']}"
@@ -55,7 +62,10 @@ class LocalMateLogger:
         
         if isinstance(data, (dict, list)):
             try:
-                formatted = json.dumps(data, ensure_ascii=False, default=str)
+                # orjson keeps non-ASCII (Vietnamese) text as-is, like ensure_ascii=False
+                formatted = orjson.dumps(
+                    data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
                 if len(formatted) > max_len:
                     return formatted[:max_len] + "..."
                 return formatted
@@ -0,0 +1,34 @@
+"""Helpers for reading uploaded files."""
+
+from fastapi import HTTPException, UploadFile
+
+# Read uploads in 64KB chunks so oversized files are rejected early
+READ_CHUNK_SIZE = 64 * 1024
+
+
+async def read_upload_limited(file: UploadFile, max_bytes: int, detail: str) -> bytes:
+    """
+    Read an upload in chunks, aborting as soon as it exceeds max_bytes.
+
+    Args:
+        file: Uploaded file
+        max_bytes: Maximum allowed size in bytes
+        detail: Error message for the 400 response
+
+    Returns:
+        File content
+
+    Raises:
+        HTTPException: 400 if the file is larger than max_bytes
+    """
+    # Reject up front when the size is already known
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(status_code=400, detail=detail)
+
+    buffer = bytearray()
+    while chunk := await file.read(READ_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise HTTPException(status_code=400, detail=detail)
+
+    return bytes(buffer)
@@ -6,6 +6,7 @@ from fastapi import APIRouter, UploadFile, File, HTTPException
 from pydantic import BaseModel, Field
 
 from app.shared.integrations.supabase_client import supabase
+from app.shared.uploads import read_upload_limited
 from app.core.config import settings
 
 
@@ -53,16 +54,13 @@ async def upload_image(
             detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_TYPES)}"
         )
     
-    # Read file content
-    content = await file.read()
-    
-    # Validate size
+    # Read file content, validating size while streaming
+    content = await read_upload_limited(
+        file,
+        max_bytes=MAX_SIZE_MB * 1024 * 1024,
+        detail=f"File too large. Max size: {MAX_SIZE_MB}MB",
+    )
     size = len(content)
-    if size > MAX_SIZE_MB * 1024 * 1024:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Max size: {MAX_SIZE_MB}MB"
-        )
     
     # Generate unique filename
     ext = file.filename.split(".")[-1] if file.filename and "." in file.filename else "jpg"
@@ -0,0 +1,99 @@
+"""Create the vector and spatial indexes used by the search tools.
+
+Safe to re-run: every statement uses IF NOT EXISTS (or only touches
+rows that still need it).
+
+Usage:
+    python scripts/create_indexes.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add app to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from neo4j import AsyncGraphDatabase
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.shared.db.session import engine
+
+INDEXES = [
+    # Image search scores with inner product, which equals cosine similarity
+    # only for unit-norm vectors. Normalize any stored embedding that isn't.
+    """
+    UPDATE place_image_embeddings
+    SET embedding = l2_normalize(embedding)
+    WHERE abs(vector_norm(embedding) - 1) > 1e-3
+    """,
+    # Image similarity (retrieve_similar_visuals). Half-precision expression
+    # index: half the size of a float32 index, same query-side cast.
+    # Inner-product ops: SigLIP embeddings are stored L2-normalized.
+    # Requires pgvector >= 0.7.
+    """
+    CREATE INDEX IF NOT EXISTS place_image_embeddings_embedding_halfvec_ip_hnsw
+    ON place_image_embeddings
+    USING hnsw ((embedding::halfvec(768)) halfvec_ip_ops)
+    WITH (m = 16, ef_construction = 64)
+    """,
+    # Text search scores with inner product, which equals cosine similarity
+    # only for unit-norm vectors. Normalize any stored embedding that isn't.
+    """
+    UPDATE place_text_embeddings
+    SET embedding = l2_normalize(embedding)
+    WHERE abs(vector_norm(embedding) - 1) > 1e-3
+    """,
+    # Text semantic search (retrieve_context_text), half-precision like above
+    """
+    CREATE INDEX IF NOT EXISTS place_text_embeddings_embedding_halfvec_ip_hnsw
+    ON place_text_embeddings
+    USING hnsw ((embedding::halfvec(768)) halfvec_ip_ops)
+    WITH (m = 16, ef_construction = 64)
+    """,
+]
+
+GRAPH_STATEMENTS = [
+    # Nearby search (find_nearby_places) filters on a native point property.
+    # Backfill it from latitude/longitude for places that don't have it yet.
+    """
+    MATCH (p:Place)
+    WHERE p.location IS NULL
+      AND p.latitude IS NOT NULL AND p.longitude IS NOT NULL
+    SET p.location = point({latitude: p.latitude, longitude: p.longitude})
+    """,
+    # Point index so point.withinBBox is an index seek instead of a scan
+    """
+    CREATE POINT INDEX place_location IF NOT EXISTS
+    FOR (p:Place) ON (p.location)
+    """,
+]
+
+
+async def main():
+    print("Creating vector indexes...")
+    async with engine.begin() as conn:
+        for ddl in INDEXES:
+            if "EXISTS" in ddl:
+                print(f"- {ddl.split('EXISTS', 1)[1].split()[0]}")
+            else:
+                print(f"- {' '.join(ddl.split()[:2])}")
+            await conn.execute(text(ddl))
+    await engine.dispose()
+
+    print("Creating Neo4j spatial index...")
+    driver = AsyncGraphDatabase.driver(
+        settings.neo4j_uri,
+        auth=(settings.neo4j_username, settings.neo4j_password),
+    )
+    async with driver.session() as session:
+        for statement in GRAPH_STATEMENTS:
+            result = await session.run(statement)
+            await result.consume()
+    await driver.close()
+    print("Done")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())